@@ -0,0 +1,42 @@
+"""
+Backend selection shared by the db dispatchers (db.connector, db.store).
+
+  AUSLEGALSEARCH_DB_BACKEND=postgres | oracle   (aliases: ora, oracle23ai)
+Default is 'postgres' to preserve current behavior.
+
+BACKEND is resolved once per process; get_backend_module(kind) imports the
+concrete module for it, e.g. get_backend_module("store") -> db.store_oracle.
+"""
+
+import importlib
+import os
+
+from db._dotenv import CONNECTION_KEYS, apply_dotenv
+
+_BACKEND_ALIASES = {
+    "postgres": "postgres",
+    "oracle": "oracle",
+    "ora": "oracle",
+    "oracle23ai": "oracle",
+}
+
+
+def _resolve() -> str:
+    # Load .env before reading backend selector (helps when running ingest/* via python -m).
+    # Skipped only when the selector and a complete connection group of that backend are exported
+    # (injected environment); otherwise .env also supplies the remaining settings read across the db package.
+    raw = os.environ.get("AUSLEGALSEARCH_DB_BACKEND")
+    if raw:
+        apply_dotenv(unless_set=CONNECTION_KEYS[_BACKEND_ALIASES.get(raw.lower(), "postgres")])
+    else:
+        apply_dotenv()
+    raw = os.environ.get("AUSLEGALSEARCH_DB_BACKEND") or "postgres"
+    return _BACKEND_ALIASES.get(raw.lower(), "postgres")
+
+
+BACKEND = _resolve()
+
+
+def get_backend_module(kind: str):
+    """Import and return db.<kind>_<BACKEND> (kind: 'connector' | 'store')."""
+    return importlib.import_module(f"db.{kind}_{BACKEND}")
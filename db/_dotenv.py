@@ -0,0 +1,78 @@
+"""
+Minimal, dependency-free .env loader shared by the db package.
+
+Reads KEY=VALUE lines from the repo-root .env (or, if absent, the CWD .env) and
+applies them to os.environ ONLY for keys that are not already exported, so
+exported env vars always take precedence. This makes `source .env` (without
+export) and `python -m ingest.*` invocations work.
+
+Each file (keyed on its realpath) is parsed at most once per process; every module that needs the values
+calls apply_dotenv(), which only replays the cached dict onto os.environ.
+Callers may pass unless_set=((...), ...) to skip the file when one complete group
+of the keys they need is already exported (systemd/containers injecting the
+environment); a partially exported group still loads the file for the rest.
+CONNECTION_KEYS holds those groups per backend.
+"""
+
+import functools
+import os
+import re
+from typing import Dict, Iterable, Optional, Tuple
+
+# One KEY=VALUE assignment per line; blank lines, '#' comments and lines without '=' never match.
+# Surrounding whitespace is excluded from both groups; quotes are stripped from the value afterwards.
+_ASSIGN_RE = re.compile(r"^[^\S\n]*([^#\s=][^=\n]*?)[^\S\n]*=[^\S\n]*(.*?)[^\S\n]*$", re.M)
+
+
+# Per backend: groups of settings that each fully describe the DB connection (a URL, or every per-field value)
+CONNECTION_KEYS: Dict[str, Tuple[Tuple[str, ...], ...]] = {
+    "postgres": (
+        ("AUSLEGALSEARCH_DB_URL",),
+        ("AUSLEGALSEARCH_DB_HOST", "AUSLEGALSEARCH_DB_PORT", "AUSLEGALSEARCH_DB_USER",
+         "AUSLEGALSEARCH_DB_PASSWORD", "AUSLEGALSEARCH_DB_NAME"),
+    ),
+    "oracle": (
+        ("ORACLE_SQLALCHEMY_URL",),
+        ("ORACLE_DB_USER", "ORACLE_DB_PASSWORD", "ORACLE_DB_DSN"),
+    ),
+}
+
+
+# Repo-root .env never moves; only the CWD candidate is recomputed per call.
+_REPO_DOTENV = os.path.realpath(os.path.join(os.path.dirname(__file__), "..", ".env"))
+
+
+def _dotenv_path() -> Optional[str]:
+    for path in (_REPO_DOTENV, os.path.realpath(os.path.join(os.getcwd(), ".env"))):
+        if os.path.exists(path):
+            return path
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _parse(path: str) -> Dict[str, str]:
+    # Keyed on the canonical path: a chdir (or symlinked .env) between imports reuses the parsed dict.
+    env: Dict[str, str] = {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            text = f.read()
+        for m in _ASSIGN_RE.finditer(text):
+            env.setdefault(m.group(1), m.group(2).strip('"').strip("'"))
+    except Exception:
+        # Never fail on dotenv load
+        pass
+    return env
+
+
+def parsed() -> Dict[str, str]:
+    path = _dotenv_path()
+    return _parse(path) if path else {}
+
+
+def apply_dotenv(unless_set: Iterable[Iterable[str]] = ()) -> None:
+    # Skip only when every key of some group is exported
+    for group in unless_set:
+        if all(k in os.environ for k in group):
+            return
+    for k, v in parsed().items():
+        os.environ.setdefault(k, v)
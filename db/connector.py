@@ -1,7 +1,7 @@
 """
 DB connector dispatcher for AUSLegalSearch v3.
 
-Selects the concrete connector at import-time based on environment:
+Selects the concrete connector based on environment:
   AUSLEGALSEARCH_DB_BACKEND=postgres | oracle
 Default is 'postgres' to preserve current behavior.
 
@@ -9,69 +9,49 @@ Re-exports a stable surface:
   - engine, SessionLocal, DB_URL
   - Vector, JSONB, UUIDType
   - ensure_pgvector()  (no-op on Oracle)
+
+BACKEND is resolved at import-time; the concrete connector (and its driver,
+SQLAlchemy engine, pgvector, ...) is only imported on first access to one of
+the re-exported names (PEP 562 module __getattr__).
 """
 
-import os as _os
+from db._backend import BACKEND, get_backend_module
+
+__all__ = [
+    "BACKEND",
+    "engine", "SessionLocal", "DB_URL",
+    "Vector", "JSONB", "UUIDType",
+    "ensure_pgvector",
+]
+
+_impl = None
+
+
+def _ensure_pgvector_noop():
+    # Not applicable on Oracle backend; keep API surface compatible.
+    return None
 
-# Minimal .env loader (dependency-free) to support CLI scripts importing this module
-def _load_dotenv_file():
-    try:
-        import os as __os
-        here = __os.path.abspath(__os.path.dirname(__file__))
-        candidates = [
-            __os.path.abspath(__os.path.join(here, "..", ".env")),   # repo root
-            __os.path.abspath(__os.path.join(__os.getcwd(), ".env")),  # current working dir
-        ]
-        for path in candidates:
-            if __os.path.exists(path):
-                with open(path, "r", encoding="utf-8") as f:
-                    for raw in f:
-                        line = raw.strip()
-                        if not line or line.startswith("#") or "=" not in line:
-                            continue
-                        k, v = line.split("=", 1)
-                        k = k.strip()
-                        v = v.strip().strip('"').strip("'")
-                        if k and k not in __os.environ:
-                            __os.environ[k] = v
-                break
-    except Exception:
-        # Never fail on dotenv load
-        pass
 
-# Load .env before reading backend selector (helps when running ingest/* via python -m)
-_load_dotenv_file()
+# Oracle connector names differ for the Postgres-compatible aliases
+_ORACLE_NAMES = {"JSONB": "JSONType"}
 
-_BACKEND = (_os.environ.get("AUSLEGALSEARCH_DB_BACKEND", "postgres") or "postgres").lower()
 
-if _BACKEND in ("oracle", "ora", "oracle23ai"):
-    # Oracle backend (python-oracledb via SQLAlchemy)
-    from db.connector_oracle import (
-        engine,
-        SessionLocal,
-        DB_URL,
-        Vector,
-        JSONType as _ORACLE_JSON,
-        UUIDType as _ORACLE_UUID,
-    )
-    # Compatibility aliases for callers expecting Postgres names
-    JSONB = _ORACLE_JSON
-    UUIDType = _ORACLE_UUID
+def _load():
+    global _impl
+    if _impl is None:
+        _impl = get_backend_module("connector")
+    return _impl
 
-    def ensure_pgvector():
-        # Not applicable on Oracle backend; keep API surface compatible.
-        return None
 
-    BACKEND = "oracle"
-else:
-    # Postgres backend (psycopg2 + pgvector)
-    from db.connector_postgres import (
-        engine,
-        SessionLocal,
-        DB_URL,
-        Vector,
-        JSONB,
-        UUIDType,
-        ensure_pgvector,
-    )
-    BACKEND = "postgres"
+def __getattr__(name):
+    if name in __all__:
+        impl = _load()
+        if BACKEND == "oracle" and name == "ensure_pgvector":
+            # Oracle backend (python-oracledb via SQLAlchemy): no pgvector
+            value = _ensure_pgvector_noop
+        else:
+            # Resolved per name, so e.g. Vector does not force the Oracle engine to be built
+            value = getattr(impl, _ORACLE_NAMES.get(name, name) if BACKEND == "oracle" else name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,11 +3,13 @@ Oracle SQLAlchemy engine/session for AUSLegalSearch v3.
 
 - Builds an SQLAlchemy engine for Oracle 26ai/23ai (Autonomous DB compatible) using python-oracledb.
 - Mirrors pool/timeouts config style used by Postgres connector.
-- Exposes: engine, SessionLocal, DB_URL, JSONType, UUIDType (String proxy), Vector (UserDefinedType emitting Oracle VECTOR).
+- Exposes: engine, SessionLocal, DB_URL (built lazily on first access), JSONType, UUIDType (String proxy), Vector (UserDefinedType emitting Oracle VECTOR).
 
 Notes:
 - Requires Oracle AI Vector Search with COMPATIBLE >= 23.4.0 to use the native VECTOR data type and vector_distance().
-- The custom Vector UserDefinedType emits "VECTOR(dim, FLOAT32, DENSE)" and binds dense literals like "[1.0,2.0,...]".
+- The custom Vector UserDefinedType emits "VECTOR(dim, FLOAT32, DENSE)". With python-oracledb >= 2.2 it binds
+  array.array values natively (typecode 'f' for FLOAT32, 'd' for FLOAT64, 'b' for INT8, 'B' for BINARY);
+  older drivers fall back to dense textual literals like "[1.0,2.0,...]".
 - Use DBMS_VECTOR to create HNSW/IVF indexes and enable APPROX vector_distance() for index usage.
 
 Env variables (either ORACLE_SQLALCHEMY_URL or the individual fields must be provided):
@@ -22,58 +24,88 @@ Pool/timeouts (optional):
 - AUSLEGALSEARCH_DB_MAX_OVERFLOW       # default 20
 - AUSLEGALSEARCH_DB_POOL_RECYCLE       # default 1800s
 - AUSLEGALSEARCH_DB_POOL_TIMEOUT       # default 30s
+- AUSLEGALSEARCH_DB_PREPING=0|1        # default 1; liveness ping on each pool checkout
+
+Driver/batching (optional):
+- AUSLEGALSEARCH_ORA_BATCH             # default 500; rows per executemany call in the db.store_oracle bulk writers
+- AUSLEGALSEARCH_ORA_STMTCACHE         # default 100; python-oracledb statement cache size per connection
+- AUSLEGALSEARCH_ORA_ARRAYSIZE         # default 500; rows fetched per round trip
+- AUSLEGALSEARCH_ORA_NATIVE_POOL=0|1   # default 0; use python-oracledb's session pool (needs ORACLE_DB_USER/PASSWORD/DSN)
+- AUSLEGALSEARCH_ORA_PING_INTERVAL     # default 60s; native pool liveness check interval
+
+Session init (optional; applied once per new database session):
+- AUSLEGALSEARCH_ORA_SESSION_CACHED_CURSORS  # default 200; ALTER SESSION SET session_cached_cursors (0 = leave as is)
+- AUSLEGALSEARCH_ORA_WARMUP=0|1               # default 0; run one vector_distance() so the first real query skips setup
 """
 
 import os
-import json
-from urllib.parse import quote_plus
+import array
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.types import UserDefinedType, Text, TypeDecorator
-try:
-    from sqlalchemy import JSON as _SAJSON  # SQLAlchemy generic JSON (may map to CLOB on Oracle)
-except Exception:
-    _SAJSON = None
-from sqlalchemy import String
-
-# Minimal .env loader (same behavior as Postgres connector)
-def _load_dotenv_file():
-    try:
-        here = os.path.abspath(os.path.dirname(__file__))
-        candidates = [
-            os.path.abspath(os.path.join(here, "..", ".env")),   # repo root
-            os.path.abspath(os.path.join(os.getcwd(), ".env")),  # current working dir
-        ]
-        for path in candidates:
-            if os.path.exists(path):
-                with open(path, "r", encoding="utf-8") as f:
-                    for raw in f:
-                        line = raw.strip()
-                        if not line or line.startswith("#") or "=" not in line:
-                            continue
-                        k, v = line.split("=", 1)
-                        k = k.strip()
-                        v = v.strip().strip('"').strip("'")
-                        if k and k not in os.environ:
-                            os.environ[k] = v
-                break
-    except Exception:
-        pass
+from sqlalchemy.pool import NullPool
+from sqlalchemy.types import UserDefinedType, String
+
+from db._dotenv import CONNECTION_KEYS, apply_dotenv
 
-_load_dotenv_file()
+# Shared .env loader (same behavior as Postgres connector); skipped when connection settings are exported
+apply_dotenv(unless_set=CONNECTION_KEYS["oracle"])
+
+# Read-once snapshot of the environment; all config below reads from this dict.
+_env = dict(os.environ)
 
 # Wallet (Autonomous DB)
-WALLET = os.environ.get("ORACLE_WALLET_LOCATION")
+WALLET = _env.get("ORACLE_WALLET_LOCATION")
 if WALLET:
     os.environ["TNS_ADMIN"] = WALLET
 
-# Build SQLAlchemy URL
-ORACLE_SQLALCHEMY_URL = os.environ.get("ORACLE_SQLALCHEMY_URL")
-if not ORACLE_SQLALCHEMY_URL:
-    ORA_USER = os.environ.get("ORACLE_DB_USER")
-    ORA_PASS = os.environ.get("ORACLE_DB_PASSWORD")
-    ORA_DSN = os.environ.get("ORACLE_DB_DSN")
+# Connection settings (validated and turned into a URL on first use of engine/DB_URL)
+ORA_USER = _env.get("ORACLE_DB_USER")
+ORA_PASS = _env.get("ORACLE_DB_PASSWORD")
+ORA_DSN = _env.get("ORACLE_DB_DSN")
+
+# Pool configuration (mirrors Postgres style)
+POOL_SIZE = int(_env.get("AUSLEGALSEARCH_DB_POOL_SIZE", "10"))
+MAX_OVERFLOW = int(_env.get("AUSLEGALSEARCH_DB_MAX_OVERFLOW", "20"))
+POOL_RECYCLE = int(_env.get("AUSLEGALSEARCH_DB_POOL_RECYCLE", "1800"))  # seconds
+POOL_TIMEOUT = int(_env.get("AUSLEGALSEARCH_DB_POOL_TIMEOUT", "30"))    # seconds
+POOL_PRE_PING = _env.get("AUSLEGALSEARCH_DB_PREPING", "1") == "1"
+
+# Driver/batching configuration (ingest throughput)
+BATCH_SIZE = int(_env.get("AUSLEGALSEARCH_ORA_BATCH", "500"))             # rows per bulk-writer executemany call
+STMT_CACHE_SIZE = int(_env.get("AUSLEGALSEARCH_ORA_STMTCACHE", "100"))    # oracledb default is 20
+ARRAY_SIZE = int(_env.get("AUSLEGALSEARCH_ORA_ARRAYSIZE", "500"))         # oracledb default is 100
+
+# Native python-oracledb session pool (opt-in). It needs the individual credential fields.
+NATIVE_POOL = _env.get("AUSLEGALSEARCH_ORA_NATIVE_POOL", "0") == "1"
+PING_INTERVAL = int(_env.get("AUSLEGALSEARCH_ORA_PING_INTERVAL", "60"))  # seconds
+
+# Per-session initialization
+SESSION_CACHED_CURSORS = int(_env.get("AUSLEGALSEARCH_ORA_SESSION_CACHED_CURSORS", "200"))
+WARMUP = _env.get("AUSLEGALSEARCH_ORA_WARMUP", "0") == "1"
+
+
+def _init_session(conn) -> None:
+    """Run once per new database session (not per checkout): server cursor cache and optional warmup."""
+    if not SESSION_CACHED_CURSORS and not WARMUP:
+        return
+    try:
+        with conn.cursor() as cur:
+            if SESSION_CACHED_CURSORS:
+                # Soft parses of repeated statements hit the session cursor cache
+                cur.execute(f"ALTER SESSION SET session_cached_cursors = {int(SESSION_CACHED_CURSORS)}")
+            if WARMUP:
+                cur.execute("SELECT vector_distance(TO_VECTOR('[0,1]'), TO_VECTOR('[1,0]'), COSINE) FROM dual")
+                cur.fetchall()
+    except Exception as e:
+        print(f"[Oracle] Session init skipped: {e}")
+
+
+def _build_url() -> str:
+    """Resolve the SQLAlchemy URL: ORACLE_SQLALCHEMY_URL, else built from the individual fields."""
+    url = _env.get("ORACLE_SQLALCHEMY_URL")
+    if url:
+        return url
     required = {"ORACLE_DB_USER": ORA_USER, "ORACLE_DB_PASSWORD": ORA_PASS, "ORACLE_DB_DSN": ORA_DSN}
     missing = [k for k, v in required.items() if not v]
     if missing:
@@ -81,31 +113,117 @@ if not ORACLE_SQLALCHEMY_URL:
             "Missing required Oracle env vars: " + ", ".join(missing) +
             ". Provide ORACLE_SQLALCHEMY_URL or ORACLE_DB_USER/ORACLE_DB_PASSWORD/ORACLE_DB_DSN."
         )
+    from urllib.parse import quote_plus
+
     # Percent-encode creds for URL safety
     user_q = quote_plus(ORA_USER)
     pwd_q = quote_plus(ORA_PASS)
     # DSN is taken as-is (TNS alias like 'myadb_high' or EZConnect 'host:port/?service_name=...').
-    ORACLE_SQLALCHEMY_URL = f"oracle+oracledb://{user_q}:{pwd_q}@{ORA_DSN}"
+    return f"oracle+oracledb://{user_q}:{pwd_q}@{ORA_DSN}"
 
-# Pool configuration (mirrors Postgres style)
-POOL_SIZE = int(os.environ.get("AUSLEGALSEARCH_DB_POOL_SIZE", "10"))
-MAX_OVERFLOW = int(os.environ.get("AUSLEGALSEARCH_DB_MAX_OVERFLOW", "20"))
-POOL_RECYCLE = int(os.environ.get("AUSLEGALSEARCH_DB_POOL_RECYCLE", "1800"))  # seconds
-POOL_TIMEOUT = int(os.environ.get("AUSLEGALSEARCH_DB_POOL_TIMEOUT", "30"))    # seconds
-
-# Connect args for oracledb via SQLAlchemy are limited compared to psycopg2;
-# keep minimal and rely on database/sqlnet configs for timeouts/keepalives.
-engine = create_engine(
-    ORACLE_SQLALCHEMY_URL,
-    pool_pre_ping=True,
-    pool_size=POOL_SIZE,
-    max_overflow=MAX_OVERFLOW,
-    pool_recycle=POOL_RECYCLE,
-    pool_timeout=POOL_TIMEOUT,
-    # No generic connect_args widely applicable here; use tnsnames/sqlnet.ora for advanced config.
-)
-SessionLocal = sessionmaker(bind=engine)
-DB_URL = ORACLE_SQLALCHEMY_URL
+
+def _build_engine(url: str):
+    native = NATIVE_POOL
+    if native and not (ORA_USER and ORA_PASS and ORA_DSN):
+        print("[Oracle] AUSLEGALSEARCH_ORA_NATIVE_POOL=1 requires ORACLE_DB_USER/ORACLE_DB_PASSWORD/ORACLE_DB_DSN; "
+              "using SQLAlchemy QueuePool")
+        native = False
+
+    if native:
+        import oracledb
+
+        # python-oracledb owns pooling (sizing, liveness pings, session lifetime); SQLAlchemy
+        # acquires/releases through creator= and must not pool on top of it (NullPool).
+        pool = oracledb.create_pool(
+            user=ORA_USER,
+            password=ORA_PASS,
+            dsn=ORA_DSN,
+            min=POOL_SIZE,
+            max=POOL_SIZE + MAX_OVERFLOW,
+            increment=1,
+            getmode=oracledb.POOL_GETMODE_TIMEDWAIT,
+            wait_timeout=POOL_TIMEOUT * 1000,       # ms; mirrors pool_timeout
+            max_lifetime_session=POOL_RECYCLE,      # mirrors pool_recycle
+            ping_interval=PING_INTERVAL,
+            stmtcachesize=STMT_CACHE_SIZE,
+            # Called for newly created sessions only (no tag requested)
+            session_callback=lambda conn, requested_tag: _init_session(conn),
+        )
+        return create_engine(
+            "oracle+oracledb://",
+            creator=pool.acquire,
+            poolclass=NullPool,
+            arraysize=ARRAY_SIZE,
+        )
+
+    # Connect args for oracledb via SQLAlchemy are limited compared to psycopg2;
+    # keep minimal and rely on database/sqlnet configs for timeouts/keepalives.
+    eng = create_engine(
+        url,
+        pool_pre_ping=POOL_PRE_PING,
+        # LIFO re-uses the most recently returned (warm, recently validated) connection and
+        # lets idle extras age out via pool_recycle
+        pool_use_lifo=True,
+        pool_size=POOL_SIZE,
+        max_overflow=MAX_OVERFLOW,
+        pool_recycle=POOL_RECYCLE,
+        pool_timeout=POOL_TIMEOUT,
+        # Rows buffered per fetch round trip (cursor.arraysize)
+        arraysize=ARRAY_SIZE,
+        # Ingest cycles through more distinct statements than oracledb's default cache (20) holds.
+        # Use tnsnames/sqlnet.ora for timeouts/keepalives and other advanced config.
+        connect_args={"stmtcachesize": STMT_CACHE_SIZE},
+    )
+
+    @event.listens_for(eng, "connect")
+    def _on_connect(dbapi_conn, connection_record):
+        _init_session(dbapi_conn)
+
+    return eng
+
+
+# engine, SessionLocal and DB_URL are built on first attribute access (PEP 562), so importing this
+# module for its column types (or db.connector just for BACKEND) does no URL validation or engine setup.
+# Sessions keep loaded attributes after commit (no re-SELECT when returned objects are read after the
+# session closes). Autoflush stays on: ingest/relational_loader.py dedupes by querying before add().
+_LAZY = ("engine", "SessionLocal", "DB_URL", "ORACLE_SQLALCHEMY_URL")
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    g = globals()
+    if "engine" not in g:
+        url = _build_url()
+        eng = _build_engine(url)
+        g.update(ORACLE_SQLALCHEMY_URL=url, DB_URL=url, SessionLocal=sessionmaker(bind=eng, expire_on_commit=False), engine=eng)
+    return g[name]
+
+_JSON_DUMPS = None
+
+def _json_dumps_fn():
+    """
+    Return the dict/list -> JSON text serializer, resolved on first use:
+    orjson when installed (optional, several times faster), stdlib json otherwise.
+    """
+    global _JSON_DUMPS
+    if _JSON_DUMPS is None:
+        import json
+        try:
+            import orjson
+        except ImportError:
+            orjson = None
+
+        def dumps(value):
+            if orjson is not None:
+                try:
+                    return orjson.dumps(value).decode("utf-8")
+                except TypeError:
+                    # orjson rejects e.g. non-str dict keys; stdlib json coerces them
+                    pass
+            return json.dumps(value, ensure_ascii=False)
+        _JSON_DUMPS = dumps
+    return _JSON_DUMPS
 
 # Type aliases to match Postgres store expectations
 # Use Oracle 26ai native JSON column type for JSON content.
@@ -117,12 +235,14 @@ class OracleJSON(UserDefinedType):
         return "JSON"
 
     def bind_processor(self, dialect):
+        dumps = _json_dumps_fn()
+
         def process(value):
             if value is None:
                 return None
             if isinstance(value, (dict, list)):
                 try:
-                    return json.dumps(value, ensure_ascii=False)
+                    return dumps(value)
                 except Exception:
                     return str(value)
             if isinstance(value, (bytes, bytearray)):
@@ -134,7 +254,26 @@ class OracleJSON(UserDefinedType):
             return value
         return process
 
+    def literal_processor(self, dialect):
+        # Inline rendering (literal_binds / compiled SQL): same serialization as binds, as a quoted SQL string
+        to_json = self.bind_processor(dialect)
+
+        def process(value):
+            value = to_json(value)
+            if value is None:
+                return "NULL"
+            return "'" + str(value).replace("'", "''") + "'"
+        return process
+
     def result_processor(self, dialect, coltype):
+        # python-oracledb decodes native JSON columns to dict/list itself; nothing to do per row.
+        dbapi = getattr(dialect, "dbapi", None)
+        if coltype is not None and coltype is getattr(dbapi, "DB_TYPE_JSON", object()):
+            return None
+
+        # Legacy CLOB/BLOB/VARCHAR2 JSON storage: decode text that looks like JSON
+        import json
+
         def process(value):
             if value is None:
                 return None
@@ -154,6 +293,24 @@ class OracleJSON(UserDefinedType):
 JSONType = OracleJSON
 UUIDType = String  # UUIDs stored as VARCHAR2(36) in Oracle backend
 
+# array.array typecodes python-oracledb (>= 2.2) binds natively as VECTOR, keyed by VECTOR format.
+_VECTOR_TYPECODES = {"FLOAT32": "f", "FLOAT64": "d", "INT8": "b", "BINARY": "B"}
+# numpy dtypes (native byte order, matching array.array) for the float typecodes; numpy arrays are
+# converted with one astype()+tobytes() memcpy instead of unboxing every element via tolist().
+# Integer formats keep the tolist() path so float input is rejected rather than silently truncated.
+_NUMPY_DTYPES = {"f": "f4", "d": "f8"}
+
+def _native_vector_binds(dialect) -> bool:
+    """True when the dialect's DBAPI is python-oracledb >= 2.2 (native VECTOR binds)."""
+    dbapi = getattr(dialect, "dbapi", None)
+    if getattr(dbapi, "__name__", None) != "oracledb":
+        return False
+    try:
+        major, minor = (int(p) for p in str(dbapi.__version__).split(".")[:2])
+    except Exception:
+        return False
+    return (major, minor) >= (2, 2)
+
 class Vector(UserDefinedType):
     """
     Oracle 26ai VECTOR column type for embeddings.
@@ -162,7 +319,8 @@ class Vector(UserDefinedType):
         Column(Vector(dim))  -> VECTOR(dim, FLOAT32, DENSE)
 
     - get_col_spec() emits VECTOR(dim, FLOAT32, DENSE) (or flexible '*' if dim is None)
-    - bind_processor converts Python list/numpy array to textual dense literal: "[1.0,2.0,...]"
+    - bind_processor converts Python list/numpy array to array.array for native binds (python-oracledb >= 2.2),
+      otherwise to a textual dense literal: "[1.0,2.0,...]"
     - result_processor returns value unchanged (vector values are rarely selected in this app)
     """
     cache_ok = True
@@ -171,31 +329,109 @@ class Vector(UserDefinedType):
         self.dim = dim
         self.fmt = (fmt or "FLOAT32").upper()
         self.storage = (storage or "DENSE").upper()
+        # DDL is fixed per instance; compute once (underscore attrs stay out of the cache key)
+        dim_s = "*" if not dim else str(int(dim))
+        fmt_s = self.fmt if self.fmt in ("INT8", "FLOAT32", "FLOAT64", "BINARY", "*") else "FLOAT32"
+        stor_s = self.storage if self.storage in ("DENSE", "SPARSE", "*") else "DENSE"
+        self._col_spec = f"VECTOR({dim_s}, {fmt_s}, {stor_s})"
+        # Text-bind element format: FLOAT32 values round-trip exactly with 9 significant digits (shorter
+        # literals than repr() of the widened double); other formats keep repr()
+        self._elem_fmt = "%.9g" if self.fmt == "FLOAT32" else "%r"
+        # Text-bind template partially evaluated on dim: "[%.9g,...,%.9g]" formats a whole vector in one C call
+        self._literal_fmt = ("[" + ",".join([self._elem_fmt] * int(dim)) + "]") if dim else None
 
     def get_col_spec(self, **kw):
-        dim = "*" if not self.dim else str(int(self.dim))
-        fmt = self.fmt if self.fmt in ("INT8", "FLOAT32", "FLOAT64", "BINARY", "*") else "FLOAT32"
-        stor = self.storage if self.storage in ("DENSE", "SPARSE", "*") else "DENSE"
-        return f"VECTOR({dim}, {fmt}, {stor})"
+        return self._col_spec
 
     def bind_processor(self, dialect):
-        def process(value):
-            if value is None:
-                return None
+        typecode = _VECTOR_TYPECODES.get(self.fmt) if _native_vector_binds(dialect) else None
+        np_dtype = _NUMPY_DTYPES.get(typecode)
+        literal_fmt = self._literal_fmt
+        fmt_elem = self._elem_fmt.__mod__
+        dim = int(self.dim) if self.dim else None
+
+        def join_text(seq):
+            if not isinstance(seq, (list, tuple)):
+                # Generators/other iterables: pack into one C double buffer ('d' keeps full precision)
+                # and stream the formatter over it instead of materializing a tuple of boxed floats
+                return "[" + ",".join(map(fmt_elem, array.array("d", seq))) + "]"
+            # map() keeps the per-element float() calls in C
+            vals = tuple(map(float, seq))
+            if len(vals) == dim:
+                return literal_fmt % vals
+            return "[" + ",".join(map(fmt_elem, vals)) + "]"
+
+        def to_text(value):
             # Accept list-like / numpy arrays and emit dense textual literal: [v0,v1,...]
             try:
-                # Try numpy first without hard dependency
-                if hasattr(value, "tolist"):
-                    seq = value.tolist()
-                else:
-                    seq = list(value)
-                return "[" + ",".join(str(float(x)) for x in seq) + "]"
+                # numpy arrays (no hard dependency): tolist() unboxes to Python floats in C
+                return join_text(value.tolist() if hasattr(value, "tolist") else value)
             except Exception:
                 # If already a string literal like "[...]" pass through
                 if isinstance(value, str) and value.startswith("[") and value.endswith("]"):
                     return value
                 # Fallback empty vector
                 return "[]"
+
+        def to_native(value):
+            # Native bind: packed binary payload, no text formatting client-side or parsing server-side
+            if isinstance(value, str):
+                return to_text(value)
+            try:
+                if isinstance(value, array.array) and value.typecode == typecode:
+                    return value
+                if np_dtype is not None and hasattr(value, "astype") and hasattr(value, "tobytes"):
+                    return array.array(typecode, value.astype(np_dtype, copy=False).tobytes())
+                return array.array(typecode, value.tolist() if hasattr(value, "tolist") else value)
+            except Exception:
+                return to_text(value)
+
+        convert = to_native if typecode is not None else to_text
+
+        def specialize(tp):
+            # Happy path for one input type, free of the isinstance/hasattr probing in convert()
+            if tp is str:
+                return to_text
+            if typecode is not None:
+                if tp is array.array:
+                    return to_native
+                if np_dtype is not None and hasattr(tp, "astype") and hasattr(tp, "tobytes"):
+                    return lambda v: array.array(typecode, v.astype(np_dtype, copy=False).tobytes())
+                if hasattr(tp, "tolist"):
+                    return lambda v: array.array(typecode, v.tolist())
+                return lambda v: array.array(typecode, v)
+            if hasattr(tp, "tolist"):
+                return lambda v: join_text(v.tolist())
+            return join_text
+
+        # Callers feed one input type per statement (lists from the API, ndarrays from the embedder),
+        # so the converter is specialized on the first value's type and only re-chosen if that changes.
+        fast_type = None
+        fast = None
+
+        def process(value):
+            nonlocal fast_type, fast
+            if value is None:
+                return None
+            tp = type(value)
+            if tp is not fast_type:
+                fast = specialize(tp)
+                fast_type = tp
+            try:
+                return fast(value)
+            except Exception:
+                return convert(value)
+        return process
+
+    def literal_processor(self, dialect):
+        # Inline rendering always uses the textual dense literal (dialect=None selects the text bind path)
+        to_text = self.bind_processor(None)
+
+        def process(value):
+            value = to_text(value)
+            if value is None:
+                return "NULL"
+            return "TO_VECTOR('" + value.replace("'", "''") + "')"
         return process
 
     def result_processor(self, dialect, coltype):
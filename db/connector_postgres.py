@@ -10,42 +10,22 @@ from urllib.parse import quote_plus
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 
-# Minimal .env loader (dependency-free). Reads KEY=VALUE lines and sets them in os.environ
-# ONLY if the key is not already exported. This makes `source .env` (without export) work.
-def _load_dotenv_file():
-    try:
-        here = os.path.abspath(os.path.dirname(__file__))
-        candidates = [
-            os.path.abspath(os.path.join(here, "..", ".env")),   # repo root
-            os.path.abspath(os.path.join(os.getcwd(), ".env")),  # current working dir
-        ]
-        for path in candidates:
-            if os.path.exists(path):
-                with open(path, "r", encoding="utf-8") as f:
-                    for raw in f:
-                        line = raw.strip()
-                        if not line or line.startswith("#") or "=" not in line:
-                            continue
-                        k, v = line.split("=", 1)
-                        k = k.strip()
-                        v = v.strip().strip('"').strip("'")
-                        if k and k not in os.environ:
-                            os.environ[k] = v
-                break
-    except Exception:
-        # Never fail due to dotenv parsing
-        pass
+from db._dotenv import CONNECTION_KEYS, apply_dotenv
 
-# Load .env before reading variables (exported env vars still take precedence)
-_load_dotenv_file()
+# Load .env before reading variables (exported env vars still take precedence);
+# skipped when connection settings are exported
+apply_dotenv(unless_set=CONNECTION_KEYS["postgres"])
 
-DB_HOST = os.environ.get("AUSLEGALSEARCH_DB_HOST")
-DB_PORT = os.environ.get("AUSLEGALSEARCH_DB_PORT")
-DB_USER = os.environ.get("AUSLEGALSEARCH_DB_USER")
-DB_PASSWORD = os.environ.get("AUSLEGALSEARCH_DB_PASSWORD")
-DB_NAME = os.environ.get("AUSLEGALSEARCH_DB_NAME")
+# Read-once snapshot of the environment; all config below reads from this dict.
+_env = dict(os.environ)
 
-DB_URL = os.environ.get("AUSLEGALSEARCH_DB_URL")
+DB_HOST = _env.get("AUSLEGALSEARCH_DB_HOST")
+DB_PORT = _env.get("AUSLEGALSEARCH_DB_PORT")
+DB_USER = _env.get("AUSLEGALSEARCH_DB_USER")
+DB_PASSWORD = _env.get("AUSLEGALSEARCH_DB_PASSWORD")
+DB_NAME = _env.get("AUSLEGALSEARCH_DB_NAME")
+
+DB_URL = _env.get("AUSLEGALSEARCH_DB_URL")
 if not DB_URL:
     # Require explicit env configuration to avoid accidental defaults.
     required = {
@@ -69,15 +49,16 @@ if not DB_URL:
 
 # Production-grade engine config:
 # - pool_pre_ping: avoid stale connections
+# - pool_use_lifo: re-use the most recently returned (warm) connection; idle extras age out via pool_recycle
 # - pool_size/max_overflow: tuneable via env, sensible defaults
 # - pool_recycle: recycle connections periodically to avoid server-side timeouts
 # - pool_timeout: bound waiting time for a free connection
 # - connect_args: psycopg2 keepalives + connect_timeout + optional statement_timeout
-POOL_SIZE = int(os.environ.get("AUSLEGALSEARCH_DB_POOL_SIZE", "10"))
-MAX_OVERFLOW = int(os.environ.get("AUSLEGALSEARCH_DB_MAX_OVERFLOW", "20"))
-POOL_RECYCLE = int(os.environ.get("AUSLEGALSEARCH_DB_POOL_RECYCLE", "1800"))  # seconds
-POOL_TIMEOUT = int(os.environ.get("AUSLEGALSEARCH_DB_POOL_TIMEOUT", "30"))    # seconds
-STATEMENT_TIMEOUT_MS = os.environ.get("AUSLEGALSEARCH_DB_STATEMENT_TIMEOUT_MS")  # e.g. "60000"
+POOL_SIZE = int(_env.get("AUSLEGALSEARCH_DB_POOL_SIZE", "10"))
+MAX_OVERFLOW = int(_env.get("AUSLEGALSEARCH_DB_MAX_OVERFLOW", "20"))
+POOL_RECYCLE = int(_env.get("AUSLEGALSEARCH_DB_POOL_RECYCLE", "1800"))  # seconds
+POOL_TIMEOUT = int(_env.get("AUSLEGALSEARCH_DB_POOL_TIMEOUT", "30"))    # seconds
+STATEMENT_TIMEOUT_MS = _env.get("AUSLEGALSEARCH_DB_STATEMENT_TIMEOUT_MS")  # e.g. "60000"
 
 connect_opts = []
 if STATEMENT_TIMEOUT_MS:
@@ -87,6 +68,7 @@ if STATEMENT_TIMEOUT_MS:
 engine = create_engine(
     DB_URL,
     pool_pre_ping=True,
+    pool_use_lifo=True,
     pool_size=POOL_SIZE,
     max_overflow=MAX_OVERFLOW,
     pool_recycle=POOL_RECYCLE,
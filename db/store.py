@@ -3,51 +3,53 @@ DB store dispatcher for AUSLegalSearch v3.
 
 Purpose:
 - Preserve existing import surface (from db.store import ...).
-- Selects the concrete backend at import-time based on environment:
+- Selects the concrete backend based on environment:
     AUSLEGALSEARCH_DB_BACKEND=postgres | oracle
 - Default is 'postgres' to maintain current behavior.
+- The backend module is imported lazily on first attribute access (PEP 562
+  module __getattr__), so callers that only need BACKEND pay no ORM/driver import.
 
 Backends:
 - Postgres (pgvector/FTS): db.store_postgres
 - Oracle 23ai (baseline, JSON vectors, LIKE search): db.store_oracle
 """
 
-import os as _os
-
-# Minimal .env loader (dependency-free) to support CLI scripts importing this module
-def _load_dotenv_file():
-    try:
-        import os as __os
-        here = __os.path.abspath(__os.path.dirname(__file__))
-        candidates = [
-            __os.path.abspath(__os.path.join(here, "..", ".env")),   # repo root
-            __os.path.abspath(__os.path.join(__os.getcwd(), ".env")),  # current working dir
-        ]
-        for path in candidates:
-            if __os.path.exists(path):
-                with open(path, "r", encoding="utf-8") as f:
-                    for raw in f:
-                        line = raw.strip()
-                        if not line or line.startswith("#") or "=" not in line:
-                            continue
-                        k, v = line.split("=", 1)
-                        k = k.strip()
-                        v = v.strip().strip('"').strip("'")
-                        if k and k not in __os.environ:
-                            __os.environ[k] = v
-                break
-    except Exception:
-        # Never fail on dotenv load
-        pass
-
-# Load .env before reading backend selector (helps when running ingest/* via python -m)
-_load_dotenv_file()
-
-_BACKEND = (_os.environ.get("AUSLEGALSEARCH_DB_BACKEND", "postgres") or "postgres").lower()
-
-if _BACKEND in ("oracle", "ora", "oracle23ai"):
-    from db.store_oracle import *  # noqa: F401,F403
-    BACKEND = "oracle"
-else:
-    from db.store_postgres import *  # noqa: F401,F403
-    BACKEND = "postgres"
+from db._backend import BACKEND, get_backend_module
+
+__all__ = [
+    "BACKEND",
+    "Base", "engine", "SessionLocal", "Vector", "JSONB", "UUIDType",
+    "User", "Document", "Embedding", "EmbeddingSession", "EmbeddingSessionFile", "ChatSession", "ConversionFile",
+    # Relational models
+    "Case", "CaseName", "CaseCitationRef", "Legislation", "LegislationSection",
+    "Journal", "JournalAuthor", "JournalCitationRef",
+    "Treaty", "TreatyCountry", "TreatyCitationRef",
+    "create_all_tables",
+    "hash_password", "check_password",
+    "create_user", "get_user_by_email", "set_last_login", "get_user_by_googleid",
+    "save_chat_session", "get_chat_session",
+    "start_session", "update_session_progress", "complete_session", "fail_session", "get_active_sessions", "get_resume_sessions", "get_session",
+    "add_document", "add_embedding", "search_vector", "search_bm25", "search_hybrid", "get_file_contents",
+    "add_conversion_file", "update_conversion_file_status",
+    "search_fts",
+]
+
+_impl = None
+
+
+def _load():
+    global _impl
+    if _impl is None:
+        impl = get_backend_module("store")
+        globals().update({k: getattr(impl, k) for k in impl.__all__})
+        _impl = impl
+    return _impl
+
+
+def __getattr__(name):
+    if name.startswith("__"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    impl = _load()
+    if name in __all__ or name in impl.__all__:
+        return getattr(impl, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,17 +2,19 @@
 Oracle backend: Centralized DB models and ORM for auslegalsearchv3.
 - Uses Oracle 26ai VECTOR data type for embeddings: Column(Vector(EMBEDDING_DIM)) -> VECTOR(dim, FLOAT32, DENSE)
 - SQL-side similarity with vector_distance(), optional APPROX to leverage HNSW/IVF indexes.
-- LIKE-based fallbacks for simple text search; Oracle Text can be added later if desired.
+- Text search via Oracle Text (CONTAINS, env gated), with LIKE-based fallbacks.
 
 Notes:
 - Ensure COMPATIBLE init parameter is >= 23.4.0 for VECTOR support.
-- VECTOR columns accept dense textual binds like "[1.0,2.0,...]" via the custom SQLAlchemy type.
+- VECTOR columns and the search query vector bind natively (array.array) via the custom SQLAlchemy type,
+  or as dense textual literals like "[1.0,2.0,...]" on older drivers.
 - Optional auto-index creation via DBMS_VECTOR.CREATE_INDEX (env gated).
 
 Env:
 - AUSLEGALSEARCH_EMBED_DIM (default 768)
 - AUSLEGALSEARCH_ORA_APPROX=1           # use APPROX vector_distance() to enable index usage
 - AUSLEGALSEARCH_ORA_AUTO_VECTOR_INDEX=0|1
+- AUSLEGALSEARCH_ORA_ENSURE_INDEXES=0|1 # add the composite lookup indexes to schemas created before them
 - AUSLEGALSEARCH_ORA_INDEX_TYPE=HNSW|IVF
 - AUSLEGALSEARCH_ORA_DISTANCE=COSINE|EUCLIDEAN|EUCLIDEAN_SQUARED|DOT|MANHATTAN|HAMMING
 - AUSLEGALSEARCH_ORA_ACCURACY=90        # target accuracy for approximate search
@@ -20,19 +22,29 @@ Env:
 - AUSLEGALSEARCH_ORA_HNSW_NEIGHBORS=16
 - AUSLEGALSEARCH_ORA_HNSW_EFCONSTRUCTION=200
 - AUSLEGALSEARCH_ORA_IVF_PARTITIONS=100
+- AUSLEGALSEARCH_ORA_TEXT=0|1          # Oracle Text: CONTEXT index on documents.content + JSON search index on
+                                        # embeddings.chunk_metadata; bm25/fts use CONTAINS/JSON_TEXTCONTAINS instead of LIKE
+- AUSLEGALSEARCH_ORA_VECTOR_RAW=0|1    # also store each embedding as raw FLOAT32 bytes (embeddings.vector_raw BLOB)
+                                        # for application-side rerank via fetch_vectors_raw()
+- AUSLEGALSEARCH_ORA_VECTOR_Q=0|1      # int8-quantized mirror (embeddings.vector_q VECTOR(dim, INT8)), filled on every insert
+- AUSLEGALSEARCH_ORA_BACKFILL_VECTOR_Q=0|1  # create_all_tables quantizes vector_q for rows that predate the mirror
+- AUSLEGALSEARCH_ORA_VECTOR_Q_SEARCH=0|1    # search_vector does coarse ANN on vector_q, then exact FLOAT32 rerank;
+                                        # set once the mirror is complete; COSINE only (other metrics use the FLOAT32 query)
+- AUSLEGALSEARCH_ORA_RERANK_FACTOR=10   # coarse candidates per requested result for the two-stage search
 """
 
-from sqlalchemy.orm import declarative_base, relationship
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, Boolean, Float, Date, Identity
-from sqlalchemy import select, text
+from sqlalchemy.orm import declarative_base, relationship, deferred, validates
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, Boolean, Float, Date, Identity, LargeBinary, Index
+from sqlalchemy import select, text, insert, update, bindparam
 from sqlalchemy import String as SAString
-from db.connector_oracle import engine, SessionLocal, Vector, JSONType
+from db.connector_oracle import engine, SessionLocal, Vector, JSONType, _json_dumps_fn, BATCH_SIZE
 from datetime import datetime
 import uuid
 import os
+import threading
+from collections import OrderedDict
 import bcrypt
 from typing import Any, Dict, List
-import json as _json
 
 # Compatibility aliases so external imports from db.store remain unchanged
 JSONB = JSONType
@@ -40,15 +52,20 @@ UUIDType = SAString  # UUID stored as VARCHAR2(36)
 
 # Production: avoid loading ML models at import-time in DB module.
 EMBEDDING_DIM = int(os.environ.get("AUSLEGALSEARCH_EMBED_DIM", "768"))
+ORA_TEXT = os.environ.get("AUSLEGALSEARCH_ORA_TEXT", "0") == "1"
+ORA_VECTOR_RAW = os.environ.get("AUSLEGALSEARCH_ORA_VECTOR_RAW", "0") == "1"
+ORA_VECTOR_Q = os.environ.get("AUSLEGALSEARCH_ORA_VECTOR_Q", "0") == "1"
+ORA_VECTOR_Q_SEARCH = ORA_VECTOR_Q and os.environ.get("AUSLEGALSEARCH_ORA_VECTOR_Q_SEARCH", "0") == "1"
 
 Base = declarative_base()
 
 def _json_text(val):
+    # dict/list -> JSON text via the connector's serializer (orjson when installed, stdlib json otherwise)
     if val is None:
         return None
     if isinstance(val, (dict, list)):
         try:
-            return _json.dumps(val, ensure_ascii=False)
+            return _json_dumps_fn()(val)
         except Exception:
             return str(val)
     if isinstance(val, bytes):
@@ -60,7 +77,7 @@ def _json_text(val):
         return val
     # Fallback: best-effort JSON serialization for other Python types
     try:
-        return _json.dumps(val, ensure_ascii=False)
+        return _json_dumps_fn()(val)
     except Exception:
         return str(val)
 
@@ -82,14 +99,43 @@ class Document(Base):
     content = Column(Text, nullable=False)
     format = Column(String(64), nullable=False)
 
+def _vector_mirrors(vector) -> Dict[str, Any]:
+    # Values of the enabled mirror columns of embeddings.vector (AUSLEGALSEARCH_ORA_VECTOR_RAW/_Q)
+    mirrors: Dict[str, Any] = {}
+    if vector is None or isinstance(vector, str):
+        return mirrors
+    if ORA_VECTOR_RAW:
+        import numpy as np
+        mirrors["vector_raw"] = np.asarray(vector, dtype=np.float32).tobytes()
+    if ORA_VECTOR_Q:
+        mirrors["vector_q"] = _quantize_int8(vector)
+    return mirrors
+
 class Embedding(Base):
     __tablename__ = "embeddings"
     id = Column(Integer, Identity(), primary_key=True)
-    doc_id = Column(Integer, ForeignKey('documents.id'), index=True)
+    doc_id = Column(Integer, ForeignKey('documents.id'))
     chunk_index = Column(Integer, nullable=False)
     vector = Column(Vector(EMBEDDING_DIM), nullable=False)  # Oracle 26ai native VECTOR(dim, FLOAT32, DENSE)
     chunk_metadata = Column(JSONB, nullable=True)
+    if ORA_VECTOR_RAW:
+        # Raw FLOAT32 bytes mirror of vector (np.frombuffer-ready); deferred so ORM loads skip the BLOB
+        vector_raw = deferred(Column(LargeBinary, nullable=True))
+    if ORA_VECTOR_Q:
+        # int8 scalar-quantized mirror of vector for the coarse ANN stage. The per-row scale is not
+        # stored: the two-stage search only runs with the COSINE metric, which is scale-invariant.
+        vector_q = deferred(Column(Vector(EMBEDDING_DIM, fmt="INT8"), nullable=True))
     document = relationship("Document", backref="embeddings")
+    if ORA_VECTOR_RAW or ORA_VECTOR_Q:
+        # Ingest workers add Embedding(...) objects directly; fill the mirrors whenever vector is set
+        @validates("vector")
+        def _fill_vector_mirrors(self, key, value):
+            for name, mirror in _vector_mirrors(value).items():
+                setattr(self, name, mirror)
+            return value
+    # Leads with doc_id, so it also serves doc_id-only lookups (no separate doc_id index).
+    # Non-unique: re-ingested schemas may already hold duplicate (doc_id, chunk_index) pairs
+    __table_args__ = (Index("ix_emb_doc_chunk", "doc_id", "chunk_index", oracle_compress=1),)
 
 class EmbeddingSession(Base):
     __tablename__ = "embedding_sessions"
@@ -104,14 +150,16 @@ class EmbeddingSession(Base):
     total_files = Column(Integer, nullable=True)
     total_chunks = Column(Integer, nullable=True)
     processed_chunks = Column(Integer, nullable=True)
+    __table_args__ = (Index("ix_sess_status_started", "status", "started_at", oracle_compress=1),)
 
 class EmbeddingSessionFile(Base):
     __tablename__ = "embedding_session_files"
     id = Column(Integer, Identity(), primary_key=True)
-    session_name = Column(String(200), nullable=False, index=True)
+    session_name = Column(String(200), nullable=False)
     filepath = Column(String(2048), nullable=False)
     status = Column(String(32), nullable=False, default="pending")
     completed_at = Column(DateTime, nullable=True)
+    __table_args__ = (Index("ix_esf_session_status", "session_name", "status", oracle_compress=1),)
 
 class ChatSession(Base):
     __tablename__ = "chat_sessions"
@@ -242,6 +290,40 @@ def create_all_tables():
     ]
     Base.metadata.create_all(engine, tables=core_tables)
 
+    # create_all only indexes tables it creates; add the composite lookup indexes to existing schemas
+    # Guarded by AUSLEGALSEARCH_ORA_ENSURE_INDEXES=1 (index builds on large tables belong in a maintenance window)
+    if os.environ.get("AUSLEGALSEARCH_ORA_ENSURE_INDEXES", "0") == "1":
+        for table in (Embedding.__table__, EmbeddingSession.__table__, EmbeddingSessionFile.__table__):
+            for idx in table.indexes:
+                try:
+                    idx.create(engine, checkfirst=True)
+                except Exception as e:
+                    print(f"[Oracle] Index {idx.name} ensure skipped: {e}")
+
+    # Existing schemas: add the raw vector mirror column when enabled (ORA-01430: column already exists)
+    if ORA_VECTOR_RAW:
+        try:
+            with engine.begin() as conn:
+                conn.exec_driver_sql("ALTER TABLE embeddings ADD (vector_raw BLOB)")
+        except Exception as e:
+            if "ORA-01430" not in str(e):
+                print(f"[Oracle] embeddings.vector_raw column ensure skipped: {e}")
+    if ORA_VECTOR_Q:
+        try:
+            with engine.begin() as conn:
+                conn.exec_driver_sql(
+                    f"ALTER TABLE embeddings ADD (vector_q VECTOR({EMBEDDING_DIM}, INT8, DENSE))"
+                )
+        except Exception as e:
+            if "ORA-01430" not in str(e):
+                print(f"[Oracle] embeddings.vector_q column ensure skipped: {e}")
+        # Re-reads every embedding without the mirror; guarded by AUSLEGALSEARCH_ORA_BACKFILL_VECTOR_Q=1
+        if os.environ.get("AUSLEGALSEARCH_ORA_BACKFILL_VECTOR_Q", "0") == "1":
+            try:
+                _backfill_vector_q()
+            except Exception as e:
+                print(f"[Oracle] embeddings.vector_q backfill skipped: {e}")
+
     # Optional: auto-create Oracle 26ai VECTOR index for embeddings.vector
     # Guarded by AUSLEGALSEARCH_ORA_AUTO_VECTOR_INDEX=1
     if os.environ.get("AUSLEGALSEARCH_ORA_AUTO_VECTOR_INDEX", "0") == "1":
@@ -273,7 +355,7 @@ def create_all_tables():
           DBMS_VECTOR.CREATE_INDEX(
             idx_name               => :idx_name,
             table_name             => 'EMBEDDINGS',
-            idx_vector_col         => 'VECTOR',
+            idx_vector_col         => :col,
             idx_include_cols       => NULL,
             idx_partitioning_scheme=> 'GLOBAL',
             idx_organization       => :org,
@@ -288,18 +370,41 @@ def create_all_tables():
             NULL;
         END;
         """)
-        try:
-            with engine.begin() as conn:
-                conn.execute(plsql, {
-                    "idx_name": idx_name,
-                    "org": org,
-                    "metric": metric,
-                    "acc": acc,
-                    "params": params_json,
-                    "par": par,
-                })
-        except Exception as e:
-            print(f"[Oracle] Vector index creation skipped: {e}")
+        indexes = [(idx_name, "VECTOR")]
+        if ORA_VECTOR_Q:
+            # Coarse-stage index for the two-stage search
+            indexes.append((idx_name + "_Q", "VECTOR_Q"))
+        for name, col in indexes:
+            try:
+                with engine.begin() as conn:
+                    conn.execute(plsql, {
+                        "idx_name": name,
+                        "col": col,
+                        "org": org,
+                        "metric": metric,
+                        "acc": acc,
+                        "params": params_json,
+                        "par": par,
+                    })
+            except Exception as e:
+                print(f"[Oracle] Vector index creation skipped: {e}")
+
+    # Optional: Oracle Text indexes for bm25/fts (CONTAINS on documents.content, JSON_TEXTCONTAINS on chunk_metadata)
+    # Guarded by AUSLEGALSEARCH_ORA_TEXT=1; SYNC (ON COMMIT) keeps them current with ingest.
+    if ORA_TEXT:
+        for ddl in (
+            "CREATE INDEX IDX_DOCS_CTX ON documents(content) INDEXTYPE IS CTXSYS.CONTEXT "
+            "PARAMETERS ('SYNC (ON COMMIT)')",
+            "CREATE SEARCH INDEX IDX_EMBED_META_JSON ON embeddings(chunk_metadata) FOR JSON "
+            "PARAMETERS ('SYNC (ON COMMIT)')",
+        ):
+            try:
+                with engine.begin() as conn:
+                    conn.exec_driver_sql(ddl)
+            except Exception as e:
+                # ORA-00955 (already exists) is the common case on restart
+                if "ORA-00955" not in str(e):
+                    print(f"[Oracle] Oracle Text index creation skipped: {e}")
 
     # Ensure Oracle PK auto-numbering for existing schemas (embedding_sessions)
     # Try identity; if not available or fails, create sequence + trigger fallback.
@@ -352,201 +457,414 @@ def create_all_tables():
         print(f"[Oracle] PK autoincrement ensure (embedding_sessions) skipped: {e}")
 
 # --- User CRUD and Auth logic ---
+# argon2id (argon2-cffi, optional) for new hashes when installed; bcrypt otherwise.
+# check_password dispatches on the stored prefix, so existing bcrypt ($2b$...) hashes keep verifying.
+try:
+    from argon2 import PasswordHasher as _PasswordHasher
+    from argon2.exceptions import VerificationError as _Argon2VerificationError, InvalidHashError as _Argon2InvalidHash
+    _ARGON2 = _PasswordHasher(time_cost=3, memory_cost=65536, parallelism=max(1, (os.cpu_count() or 2) // 2))
+except ImportError:
+    _ARGON2 = None
+
 def hash_password(password: str) -> str:
+    if _ARGON2 is not None:
+        return _ARGON2.hash(password)
     return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
 
 def check_password(password: str, hashval: str) -> bool:
+    if hashval.startswith("$argon2"):
+        if _ARGON2 is None:
+            return False
+        try:
+            return _ARGON2.verify(hashval, password)
+        except (_Argon2VerificationError, _Argon2InvalidHash):
+            return False
     return bcrypt.checkpw(password.encode('utf-8'), hashval.encode('utf-8'))
 
 def create_user(email, password=None, name=None, google_id=None, registered_google=False):
+    # INSERT ... RETURNING loads the new row in the same round trip (no refresh SELECT)
+    stmt = insert(User).values(
+        email=email,
+        password_hash=hash_password(password) if password else None,
+        name=name,
+        google_id=google_id,
+        registered_google=registered_google,
+        created_at=datetime.utcnow(),
+        last_login=datetime.utcnow(),
+    ).returning(User)
     with SessionLocal() as session:
-        user = User(
-            email=email,
-            password_hash=hash_password(password) if password else None,
-            name=name,
-            google_id=google_id,
-            registered_google=registered_google,
-            created_at=datetime.utcnow(),
-            last_login=datetime.utcnow(),
-        )
-        session.add(user)
+        user = session.scalars(stmt).one()
         session.commit()
-        session.refresh(user)
         return user
 
 def get_user_by_email(email: str):
     with SessionLocal() as session:
-        return session.query(User).filter_by(email=email).first()
+        return session.scalars(select(User).where(User.email == email).limit(1)).first()
 
 def set_last_login(user_id: int):
     with SessionLocal() as session:
-        user = session.query(User).filter_by(id=user_id).first()
-        if user:
-            user.last_login = datetime.utcnow()
-            session.commit()
+        session.execute(update(User).where(User.id == user_id).values(last_login=datetime.utcnow()))
+        session.commit()
 
 def get_user_by_googleid(google_id: str):
     with SessionLocal() as session:
-        return session.query(User).filter_by(google_id=google_id).first()
+        return session.scalars(select(User).where(User.google_id == google_id).limit(1)).first()
 
 # -- Chat Session functions --
 def save_chat_session(chat_history, llm_params, ended_at=None, username=None, question=None):
+    stmt = insert(ChatSession).values(
+        chat_history=_json_text(chat_history),
+        llm_params=_json_text(llm_params),
+        ended_at=ended_at or datetime.utcnow(),
+        username=username,
+        question=question
+    ).returning(ChatSession.id)
     with SessionLocal() as session:
-        chat_sess = ChatSession(
-            chat_history=_json_text(chat_history),
-            llm_params=_json_text(llm_params),
-            ended_at=ended_at or datetime.utcnow(),
-            username=username,
-            question=question
-        )
-        session.add(chat_sess)
+        chat_id = session.execute(stmt).scalar_one()
         session.commit()
-        session.refresh(chat_sess)
-        return chat_sess.id
+        return chat_id
 
 def get_chat_session(chat_id):
     with SessionLocal() as session:
-        return session.query(ChatSession).filter_by(id=chat_id).first()
+        return session.get(ChatSession, chat_id)
 
 # ---- Embedding/DOC ingest/session tracking ----
 def start_session(session_name, directory, total_files=None, total_chunks=None):
+    stmt = insert(EmbeddingSession).values(
+        session_name=session_name,
+        directory=directory,
+        started_at=datetime.utcnow(),
+        status="active",
+        total_files=total_files,
+        total_chunks=total_chunks,
+        processed_chunks=0
+    ).returning(EmbeddingSession)
     with SessionLocal() as session:
-        sess = EmbeddingSession(
-            session_name=session_name,
-            directory=directory,
-            started_at=datetime.utcnow(),
-            status="active",
-            total_files=total_files,
-            total_chunks=total_chunks,
-            processed_chunks=0
-        )
-        session.add(sess)
+        sess = session.scalars(stmt).one()
         session.commit()
-        session.refresh(sess)
         return sess
 
-def update_session_progress(session_name, last_file, last_chunk, processed_chunks):
+# Statements for the per-chunk session bookkeeping, built once at import: each call only binds
+# parameters (SQLAlchemy compiled cache + driver statement cache), and updates skip the SELECT.
+_SESS_BY_NAME = select(EmbeddingSession).where(EmbeddingSession.session_name == bindparam("n")).limit(1)
+_UPD_SESS_PROGRESS = (
+    update(EmbeddingSession)
+    .where(EmbeddingSession.session_name == bindparam("n"))
+    .values(last_file=bindparam("lf"), last_chunk=bindparam("lc"), processed_chunks=bindparam("pc"))
+    .returning(EmbeddingSession)
+)
+_UPD_SESS_COMPLETE = (
+    update(EmbeddingSession)
+    .where(EmbeddingSession.session_name == bindparam("n"))
+    .values(ended_at=bindparam("ea"), status="complete")
+    .returning(EmbeddingSession)
+)
+_UPD_SESS_FAIL = (
+    update(EmbeddingSession)
+    .where(EmbeddingSession.session_name == bindparam("n"))
+    .values(status="error")
+    .returning(EmbeddingSession)
+)
+
+def _update_session(stmt, params):
+    # Single UPDATE ... RETURNING (no SELECT + ORM load); returns the updated row or None
     with SessionLocal() as session:
-        sess = session.query(EmbeddingSession).filter_by(session_name=session_name).first()
-        if not sess:
-            return None
-        sess.last_file = last_file
-        sess.last_chunk = last_chunk
-        sess.processed_chunks = processed_chunks
+        sess = session.scalars(stmt, params).first()
         session.commit()
         return sess
 
+def update_session_progress(session_name, last_file, last_chunk, processed_chunks):
+    return _update_session(_UPD_SESS_PROGRESS, {"n": session_name, "lf": last_file, "lc": last_chunk, "pc": processed_chunks})
+
 def complete_session(session_name):
-    with SessionLocal() as session:
-        sess = session.query(EmbeddingSession).filter_by(session_name=session_name).first()
-        if not sess:
-            return None
-        sess.ended_at = datetime.utcnow()
-        sess.status = "complete"
-        session.commit()
-        return sess
+    return _update_session(_UPD_SESS_COMPLETE, {"n": session_name, "ea": datetime.utcnow()})
 
 def fail_session(session_name):
-    with SessionLocal() as session:
-        sess = session.query(EmbeddingSession).filter_by(session_name=session_name).first()
-        if not sess:
-            return None
-        sess.status = "error"
-        session.commit()
-        return sess
+    return _update_session(_UPD_SESS_FAIL, {"n": session_name})
 
 def get_active_sessions():
     with SessionLocal() as session:
-        sessions = session.query(EmbeddingSession).filter(EmbeddingSession.status == "active").all()
-        return sessions
+        return session.scalars(select(EmbeddingSession).where(EmbeddingSession.status == "active")).all()
 
 def get_resume_sessions():
     with SessionLocal() as session:
-        return session.query(EmbeddingSession).filter(EmbeddingSession.status != "complete").all()
+        return session.scalars(select(EmbeddingSession).where(EmbeddingSession.status != "complete")).all()
 
 def get_session(session_name):
     with SessionLocal() as session:
-        return session.query(EmbeddingSession).filter_by(session_name=session_name).first()
+        return session.scalars(_SESS_BY_NAME, {"n": session_name}).first()
 
-def add_document(doc: dict) -> int:
+def _insert_returning_ids(model, rows: List[Dict[str, Any]]) -> List[int]:
+    # The Oracle dialect sends executemany INSERT ... RETURNING as one array-bound call (no
+    # insertmanyvalues paging), so page explicitly by AUSLEGALSEARCH_ORA_BATCH; one transaction overall.
+    stmt = insert(model).returning(model.id, sort_by_parameter_order=True)
+    ids: List[int] = []
     with SessionLocal() as session:
-        doc_obj = Document(
-            source=doc["source"],
-            content=doc["content"],
-            format=doc["format"],
-        )
-        session.add(doc_obj)
+        for i in range(0, len(rows), BATCH_SIZE):
+            ids.extend(session.scalars(stmt, rows[i:i + BATCH_SIZE]))
         session.commit()
-        session.refresh(doc_obj)
-        return doc_obj.id
+    return ids
+
+def add_documents_bulk(docs: List[Dict[str, Any]]) -> List[int]:
+    """
+    Insert many documents with executemany (AUSLEGALSEARCH_ORA_BATCH rows per call, one
+    transaction) and return their ids in input order.
+    """
+    if not docs:
+        return []
+    rows = [{"source": d["source"], "content": d["content"], "format": d["format"]} for d in docs]
+    return _insert_returning_ids(Document, rows)
+
+def _quantize_int8(vec):
+    """Symmetric scalar quantization to an int8 ndarray: q = round(v / scale), scale = max|v| / 127."""
+    import numpy as np
+
+    v = np.asarray(vec, dtype=np.float32).ravel()
+    peak = float(np.abs(v).max()) if v.size else 0.0
+    scale = peak / 127.0 if peak > 0 else 1.0
+    return np.clip(np.rint(v / scale), -127, 127).astype(np.int8)
+
+def _backfill_vector_q():
+    """Quantize embeddings.vector into vector_q for rows that predate the mirror, BATCH_SIZE rows per round trip."""
+    tbl = Embedding.__table__
+    pending = (
+        select(tbl.c.id, tbl.c.vector)
+        .where(tbl.c.vector_q.is_(None), tbl.c.id > bindparam("after"))
+        .order_by(tbl.c.id)
+        .limit(BATCH_SIZE)
+    )
+    stmt = update(tbl).where(tbl.c.id == bindparam("b_id")).values(vector_q=bindparam("b_q"))
+    after = 0
+    total = 0
+    while True:
+        with engine.begin() as conn:
+            rows = conn.execute(pending, {"after": after}).fetchall()
+            if not rows:
+                break
+            conn.execute(stmt, [{"b_id": r[0], "b_q": _quantize_int8(r[1])} for r in rows])
+        after = rows[-1][0]
+        total += len(rows)
+    if total:
+        print(f"[Oracle] embeddings.vector_q backfilled for {total} rows")
+
+def add_embeddings_bulk(rows: List[Dict[str, Any]]) -> List[int]:
+    """
+    Insert many embeddings with executemany (AUSLEGALSEARCH_ORA_BATCH rows per call, one
+    transaction) and return their ids in input order.
+    rows: dicts with doc_id, chunk_index, vector and optional chunk_metadata.
+    Vectors are bound natively (array.array) or as text literals by the Vector type.
+    """
+    if not rows:
+        return []
+    params = [
+        {
+            "doc_id": r["doc_id"],
+            "chunk_index": r["chunk_index"],
+            "vector": r["vector"],
+            "chunk_metadata": _json_text(r.get("chunk_metadata")),
+        }
+        for r in rows
+    ]
+    if ORA_VECTOR_RAW or ORA_VECTOR_Q:
+        # Core-style bulk insert bypasses @validates, so the mirrors are filled here
+        for p in params:
+            p.update(_vector_mirrors(p["vector"]))
+    return _insert_returning_ids(Embedding, params)
+
+def add_document(doc: dict) -> int:
+    # Single-row form kept for existing callers; prefer add_documents_bulk during ingest
+    return add_documents_bulk([doc])[0]
 
 def add_embedding(doc_id: int, chunk_index: int, vector, chunk_metadata=None) -> int:
+    # Single-row form kept for existing callers; prefer add_embeddings_bulk during ingest
+    return add_embeddings_bulk([{
+        "doc_id": doc_id,
+        "chunk_index": chunk_index,
+        "vector": vector,
+        "chunk_metadata": chunk_metadata,
+    }])[0]
+
+# Oracle IN-list limit
+_IN_LIST_MAX = 1000
+
+def fetch_vectors_raw(doc_ids):
+    """
+    Load the embeddings of doc_ids for application-side rerank.
+    Returns (keys, M): keys is a list of (doc_id, chunk_index) and M an (N, dim) float32 ndarray in the
+    same order. Reads embeddings.vector_raw (one memcpy per row) when AUSLEGALSEARCH_ORA_VECTOR_RAW=1,
+    and the VECTOR column itself (python-oracledb returns it as array.array) otherwise or where
+    vector_raw is NULL.
+    """
+    import numpy as np
+
+    ids = list(dict.fromkeys(int(i) for i in doc_ids))
+    col = Embedding.vector_raw if ORA_VECTOR_RAW else Embedding.vector
+    keys = []
+    vecs = []
+    missing = {}  # embeddings.id -> position in vecs, for rows whose vector_raw is NULL
     with SessionLocal() as session:
-        embed_obj = Embedding(
-            doc_id=doc_id,
-            chunk_index=chunk_index,
-            vector=vector,
-            chunk_metadata=_json_text(chunk_metadata),
-        )
-        session.add(embed_obj)
-        session.commit()
-        session.refresh(embed_obj)
-        return embed_obj.id
+        for i in range(0, len(ids), _IN_LIST_MAX):
+            stmt = (
+                select(Embedding.id, Embedding.doc_id, Embedding.chunk_index, col)
+                .where(Embedding.doc_id.in_(ids[i:i + _IN_LIST_MAX]))
+                .order_by(Embedding.doc_id, Embedding.chunk_index)
+            )
+            for emb_id, doc_id, chunk_index, val in session.execute(stmt):
+                if val is None and not ORA_VECTOR_RAW:
+                    continue
+                keys.append((doc_id, chunk_index))
+                if val is None:
+                    missing[emb_id] = len(vecs)
+                    vecs.append(None)
+                elif ORA_VECTOR_RAW:
+                    vecs.append(np.frombuffer(val, dtype=np.float32))
+                else:
+                    vecs.append(np.asarray(val, dtype=np.float32))
+        # Rows written before vector_raw existed: fetch the VECTOR value for just those ids
+        if missing:
+            miss_ids = list(missing)
+            for i in range(0, len(miss_ids), _IN_LIST_MAX):
+                stmt = select(Embedding.id, Embedding.vector).where(Embedding.id.in_(miss_ids[i:i + _IN_LIST_MAX]))
+                for emb_id, vec in session.execute(stmt):
+                    vecs[missing[emb_id]] = np.asarray(vec, dtype=np.float32)
+    if not vecs:
+        return keys, np.zeros((0, EMBEDDING_DIM), dtype=np.float32)
+    return keys, np.vstack(vecs)
 
 # --- Search helpers (Oracle) ---
 
-def _cosine_distance(a: List[float], b: List[float]) -> float:
-    # Return cosine distance = 1 - cosine_similarity
-    if not a or not b:
+def _cosine_distance(a, b) -> float:
+    # Return cosine distance = 1 - cosine_similarity (dot/norms via numpy BLAS; ndarrays are used without a copy)
+    import numpy as np
+
+    if a is None or b is None or len(a) == 0 or len(b) == 0:
         return 1.0
-    n = min(len(a), len(b))
-    dot = 0.0
-    na = 0.0
-    nb = 0.0
-    for i in range(n):
-        x = float(a[i])
-        y = float(b[i])
-        dot += x * y
-        na += x * x
-        nb += y * y
+    a = np.asarray(a, dtype=np.float32).ravel()
+    b = np.asarray(b, dtype=np.float32).ravel()
+    n = min(a.shape[0], b.shape[0])
+    a, b = a[:n], b[:n]
+    na = float(a @ a)
+    nb = float(b @ b)
     if na <= 0 or nb <= 0:
         return 1.0
-    return 1.0 - (dot / ((na ** 0.5) * (nb ** 0.5)))
+    return 1.0 - float(a @ b) / ((na ** 0.5) * (nb ** 0.5))
+
+def _cosine_distance_batch(q, M):
+    """
+    Cosine distances between one query q (dim,) and each row of M (n, dim) in a single
+    matrix-vector product; rows (or a query) with zero norm get distance 1.0.
+    """
+    import numpy as np
+
+    q = np.asarray(q, dtype=np.float32).ravel()
+    M = np.asarray(M, dtype=np.float32)
+    if M.ndim != 2 or M.shape[0] == 0:
+        return np.zeros((0,), dtype=np.float32)
+    qn = float(np.linalg.norm(q))
+    if qn <= 0:
+        return np.ones((M.shape[0],), dtype=np.float32)
+    norms = np.linalg.norm(M, axis=1) * qn
+    sims = np.divide(M @ q, norms, out=np.zeros_like(norms), where=norms > 0)
+    return 1.0 - sims
+
+# Distance metrics accepted by vector_distance() (inlined into SQL, so whitelisted)
+_VECTOR_METRICS = ("COSINE", "EUCLIDEAN", "EUCLIDEAN_SQUARED", "DOT", "MANHATTAN", "HAMMING")
+
+def _vector_search_clauses(limit_param: str):
+    """(metric, FETCH clause) for vector top-k queries, from AUSLEGALSEARCH_ORA_DISTANCE/APPROX/ACCURACY."""
+    metric = (os.environ.get("AUSLEGALSEARCH_ORA_DISTANCE", "COSINE") or "COSINE").upper()
+    if metric not in _VECTOR_METRICS:
+        metric = "COSINE"
+    if os.environ.get("AUSLEGALSEARCH_ORA_APPROX", "1") == "1":
+        acc = int(os.environ.get("AUSLEGALSEARCH_ORA_ACCURACY", "90"))
+        return metric, f"FETCH APPROX FIRST :{limit_param} ROWS ONLY WITH TARGET ACCURACY {acc}"
+    return metric, f"FETCH FIRST :{limit_param} ROWS ONLY"
+
+def _search_vector_two_stage(query_vec, top_k):
+    """
+    Coarse ANN over the int8 mirror (vector_q; a quarter of the FLOAT32 bytes per probe) for
+    top_k * AUSLEGALSEARCH_ORA_RERANK_FACTOR candidates, then exact FLOAT32 vector_distance rerank
+    of just those rows. Same result shape as search_vector. Only used for the COSINE metric: the int8
+    codes carry a different scale per row, which only a scale-invariant distance ranks correctly.
+    """
+    metric, fetch = _vector_search_clauses("k")
+    factor = max(1, int(os.environ.get("AUSLEGALSEARCH_ORA_RERANK_FACTOR", "10")))
+    sql = f"""
+        WITH c AS (
+            SELECT e.id
+              FROM embeddings e
+             WHERE e.vector_q IS NOT NULL
+             ORDER BY vector_distance(e.vector_q, :qq, {metric})
+             {fetch}
+        )
+        SELECT e.doc_id,
+               e.chunk_index,
+               vector_distance(e.vector, :qv, {metric}) AS score,
+               d.content,
+               d.source,
+               d.format,
+               e.chunk_metadata
+          FROM c
+          JOIN embeddings e ON e.id = c.id
+          JOIN documents d ON e.doc_id = d.id
+         ORDER BY score
+         FETCH FIRST :topk ROWS ONLY
+    """
+    stmt = text(sql).bindparams(
+        bindparam("qv", type_=Vector(EMBEDDING_DIM)),
+        bindparam("qq", type_=Vector(EMBEDDING_DIM, fmt="INT8")),
+    )
+    params = {"qv": query_vec, "qq": _quantize_int8(query_vec), "k": int(top_k) * factor, "topk": int(top_k)}
+    with SessionLocal() as session:
+        rows = session.execute(stmt, params).fetchall()
+    return [
+        {
+            "doc_id": row[0],
+            "chunk_index": row[1],
+            "score": row[2],
+            "text": row[3],
+            "source": row[4],
+            "format": row[5],
+            "chunk_metadata": row[6],
+        }
+        for row in rows
+    ]
 
 def search_vector(query_vec, top_k=5):
     """
     Oracle VECTOR search using SQL-side vector_distance() with optional APPROX
     to enable HNSW/IVF vector index usage when present.
 
+    The distance is evaluated once per row: ORDER BY refers to the projected score alias,
+    and top-k uses FETCH [APPROX] FIRST so the optimizer can pick the vector index.
+
     Env:
-      - AUSLEGALSEARCH_ORA_APPROX=1 (default) to use APPROX keyword for index
+      - AUSLEGALSEARCH_ORA_APPROX=1 (default) to use FETCH APPROX FIRST ... WITH TARGET ACCURACY
+      - AUSLEGALSEARCH_ORA_DISTANCE (default COSINE; should match the vector index metric)
+      - AUSLEGALSEARCH_ORA_ACCURACY (default 90)
     """
-    approx = os.environ.get("AUSLEGALSEARCH_ORA_APPROX", "1") == "1"
-    # Prepare dense textual literal for the bind (e.g., "[1.0,2.0,...]")
-    try:
-        seq = query_vec.tolist() if hasattr(query_vec, "tolist") else list(query_vec or [])
-    except Exception:
-        seq = []
-    qv_text = "[" + ",".join(str(float(v)) for v in seq) + "]"
-    order_expr = "vector_distance(e.vector, :qv)"
+    metric, fetch = _vector_search_clauses("topk")
+    if ORA_VECTOR_Q_SEARCH and metric == "COSINE":
+        return _search_vector_two_stage(query_vec, top_k)
 
     sql = f"""
-        SELECT * FROM (
-            SELECT e.doc_id,
-                   e.chunk_index,
-                   {order_expr} AS score,
-                   d.content,
-                   d.source,
-                   d.format,
-                   e.chunk_metadata
-              FROM embeddings e
-              JOIN documents d ON e.doc_id = d.id
-             ORDER BY {order_expr}
-        ) 
-        WHERE ROWNUM <= :topk
+        SELECT e.doc_id,
+               e.chunk_index,
+               vector_distance(e.vector, :qv, {metric}) AS score,
+               d.content,
+               d.source,
+               d.format,
+               e.chunk_metadata
+          FROM embeddings e
+          JOIN documents d ON e.doc_id = d.id
+         ORDER BY score
+         {fetch}
     """
+    # :qv is typed as Vector so the query vector binds like stored embeddings: a native FLOAT32
+    # array.array on python-oracledb >= 2.2 (textual literal on older drivers), no per-call formatting here
+    stmt = text(sql).bindparams(bindparam("qv", type_=Vector(EMBEDDING_DIM)))
     with SessionLocal() as session:
-        rows = session.execute(text(sql), {"qv": qv_text, "topk": int(top_k)}).fetchall()
+        rows = session.execute(stmt, {"qv": query_vec, "topk": int(top_k)}).fetchall()
         hits = []
         for row in rows:
             hits.append({
@@ -560,41 +878,149 @@ def search_vector(query_vec, top_k=5):
             })
         return hits
 
+def _ctx_query(query: str) -> str:
+    # Oracle Text query for the literal phrase: {...} escapes every reserved word/character ('}' doubles),
+    # equivalent to ctx_query.escape_reserved_words without a server round trip
+    return "{" + query.replace("}", "}}") + "}"
+
 def search_bm25(query, top_k=5):
     """
-    Oracle baseline: simple case-insensitive LIKE on documents.content.
+    Oracle Text CONTAINS over documents.content ranked by SCORE() when AUSLEGALSEARCH_ORA_TEXT=1
+    (falls back to LIKE if the CONTEXT index is unavailable); otherwise a case-insensitive LIKE.
     """
+    query = query or ""
+    res = None
+    if ORA_TEXT and query.strip():
+        try:
+            with SessionLocal() as session:
+                res = session.execute(
+                    text("""
+                        SELECT id, content, source, format, SCORE(1) AS s
+                        FROM documents
+                        WHERE CONTAINS(content, :q, 1) > 0
+                        ORDER BY s DESC
+                        FETCH FIRST :topk ROWS ONLY
+                    """),
+                    {"q": _ctx_query(query), "topk": int(top_k)}
+                ).fetchall()
+        except Exception as e:
+            print(f"[Oracle] CONTAINS search failed, using LIKE: {e}")
+    if res is None:
+        with SessionLocal() as session:
+            res = session.execute(
+                text("""
+                    SELECT id, content, source, format, 1.0 AS s
+                    FROM documents
+                    WHERE LOWER(content) LIKE :q
+                    FETCH FIRST :topk ROWS ONLY
+                """),
+                {"q": f"%{query.lower()}%", "topk": int(top_k)}
+            ).fetchall()
+    hits = []
+    for row in res:
+        hits.append({
+            "doc_id": row[0],
+            "chunk_index": 0,
+            "score": float(row[4]),
+            "text": row[1],
+            "source": row[2],
+            "format": row[3],
+            "chunk_metadata": None,
+        })
+    return hits
+
+_EMBEDDER = None
+_EMBEDDER_LOCK = threading.Lock()
+
+def _get_embedder():
+    # Process-wide Embedder for query embedding; loading the model costs far more than the search itself
+    global _EMBEDDER
+    if _EMBEDDER is None:
+        with _EMBEDDER_LOCK:
+            if _EMBEDDER is None:
+                from embedding.embedder import Embedder
+                _EMBEDDER = Embedder()
+    return _EMBEDDER
+
+def _search_hybrid_sql(query_vec, query, top_k, alpha):
+    """
+    Hybrid search in one round trip (needs the Oracle Text index): vector top-k and CONTAINS top-k
+    are fused in SQL. Same fusion as the Python path in search_hybrid: candidates keyed on
+    (doc_id, chunk_index) with text hits as chunk 0, distance min-max normalized over the vector
+    hits (0 for text-only hits), text score normalized by its maximum.
+    """
+    metric, fetch = _vector_search_clauses("k")
+    sql = f"""
+        WITH v AS (
+            SELECT e.doc_id, e.chunk_index, e.chunk_metadata,
+                   vector_distance(e.vector, :qv, {metric}) AS dist
+              FROM embeddings e
+             ORDER BY dist
+             {fetch}
+        ), t AS (
+            SELECT id AS doc_id, SCORE(1) AS s
+              FROM documents
+             WHERE CONTAINS(content, :q, 1) > 0
+             ORDER BY s DESC
+             FETCH FIRST :k ROWS ONLY
+        ), f AS (
+            SELECT COALESCE(v.doc_id, t.doc_id) AS doc_id,
+                   COALESCE(v.chunk_index, 0) AS chunk_index,
+                   v.chunk_metadata, v.dist, NVL(t.s, 0) AS s
+              FROM v FULL OUTER JOIN t ON v.doc_id = t.doc_id AND v.chunk_index = 0
+        ), n AS (
+            SELECT f.*,
+                   CASE WHEN f.dist IS NULL THEN 0
+                        WHEN MAX(f.dist) OVER () = MIN(f.dist) OVER () THEN 1
+                        ELSE 1 - (f.dist - MIN(f.dist) OVER ()) / (MAX(f.dist) OVER () - MIN(f.dist) OVER ())
+                   END AS vn,
+                   CASE WHEN MAX(f.s) OVER () > 0 THEN f.s / MAX(f.s) OVER () ELSE 0 END AS tn
+              FROM f
+        )
+        SELECT n.doc_id, n.chunk_index, n.dist, n.s, n.vn, n.tn,
+               :alpha * n.vn + (1 - :alpha) * n.tn AS hybrid,
+               doc.content, doc.source, doc.format, n.chunk_metadata
+          FROM n
+          JOIN documents doc ON doc.id = n.doc_id
+         ORDER BY hybrid DESC
+         FETCH FIRST :topk ROWS ONLY
+    """
+    stmt = text(sql).bindparams(bindparam("qv", type_=Vector(EMBEDDING_DIM)))
+    params = {"qv": query_vec, "q": _ctx_query(query), "k": int(top_k) * 2, "alpha": float(alpha), "topk": int(top_k)}
     with SessionLocal() as session:
-        q = f"%{(query or '').lower()}%"
-        res = session.execute(
-            text("""
-                SELECT id, content, source, format
-                FROM documents
-                WHERE LOWER(content) LIKE :q
-                FETCH FIRST :topk ROWS ONLY
-            """),
-            {"q": q, "topk": int(top_k)}
-        ).fetchall()
-        hits = []
-        for row in res:
-            hits.append({
-                "doc_id": row[0],
-                "chunk_index": 0,
-                "score": 1.0,
-                "text": row[1],
-                "source": row[2],
-                "format": row[3],
-                "chunk_metadata": None,
-            })
-        return hits
+        rows = session.execute(stmt, params).fetchall()
+    results = []
+    for row in rows:
+        results.append({
+            "doc_id": row[0],
+            "chunk_index": row[1],
+            # Distance, as in search_vector; text-only hits get the neutral cosine distance 1.0
+            "score": row[2] if row[2] is not None else 1.0,
+            "text": row[7],
+            "source": row[8],
+            "format": row[9],
+            "chunk_metadata": row[10],
+            "vector_score": row[2] if row[2] is not None else 0.0,
+            "bm25_score": float(row[5]),
+            "vector_score_norm": float(row[4]),
+            "hybrid_score": float(row[6]),
+            "citation": f"{row[8]}#chunk{row[1] or 0}",
+        })
+    return results
 
 def search_hybrid(query, top_k=5, alpha=0.5):
-    from embedding.embedder import Embedder
-    embedder = Embedder()
-    query_vec = embedder.embed([query])[0]
+    query_vec = _get_embedder().embed([query])[0]
+    if ORA_TEXT and (query or "").strip():
+        try:
+            return _search_hybrid_sql(query_vec, query, top_k, alpha)
+        except Exception as e:
+            print(f"[Oracle] SQL hybrid search failed, fusing in Python: {e}")
     vector_hits = search_vector(query_vec, top_k=top_k * 2)
     bm25_hits = search_bm25(query, top_k=top_k * 2)
 
+    # Text relevance normalized by its maximum (LIKE hits all score 1.0), as in _search_hybrid_sql
+    max_text = max((float(h["score"]) for h in bm25_hits), default=0.0)
+
     all_hits: Dict[Any, Dict[str, Any]] = {}
     for h in vector_hits:
         key = (h["doc_id"], h["chunk_index"])
@@ -603,126 +1029,230 @@ def search_hybrid(query, top_k=5, alpha=0.5):
             "vector_score": h["score"],
             "bm25_score": 0.0,
             "hybrid_score": 0.0,
+            "_has_vector": True,
         }
     for h in bm25_hits:
         key = (h["doc_id"], h["chunk_index"])
+        text_score = float(h["score"]) / max_text if max_text > 0 else 0.0
         if key in all_hits:
-            all_hits[key]["bm25_score"] = 1.0
+            all_hits[key]["bm25_score"] = text_score
         else:
             all_hits[key] = {
                 **h,
+                # score keeps its distance meaning; text-only hits get the neutral cosine distance 1.0
+                "score": 1.0,
                 "vector_score": 0.0,
-                "bm25_score": 1.0,
+                "bm25_score": text_score,
                 "hybrid_score": 0.0,
+                "_has_vector": False,
             }
-    scores = [v["vector_score"] for v in all_hits.values()]
-    if scores:
-        minv, maxv = min(scores), max(scores)
-        for v in all_hits.values():
-            if maxv != minv:
-                v["vector_score_norm"] = 1.0 - ((v["vector_score"] - minv) / (maxv - minv))
-            else:
-                v["vector_score_norm"] = 1.0
-    else:
-        for v in all_hits.values():
-            v["vector_score_norm"] = 0.0
-    for v in all_hits.values():
-        v["hybrid_score"] = alpha * v["vector_score_norm"] + (1 - alpha) * v["bm25_score"]
-    results = sorted(all_hits.values(), key=lambda x: x["hybrid_score"], reverse=True)[:top_k]
+    # Min-max normalization (over the vector hits only; text-only hits get 0) and weighting
+    # as numpy ufuncs over all candidates at once
+    import numpy as np
+
+    hits = list(all_hits.values())
+    n = len(hits)
+    scores = np.fromiter((float(v["vector_score"]) for v in hits), dtype=np.float64, count=n)
+    bm25 = np.fromiter((float(v["bm25_score"]) for v in hits), dtype=np.float64, count=n)
+    has_vec = np.fromiter((v.pop("_has_vector") for v in hits), dtype=bool, count=n)
+    norm = np.zeros(n)
+    if has_vec.any():
+        vs = scores[has_vec]
+        span = vs.max() - vs.min()
+        norm[has_vec] = 1.0 - (vs - vs.min()) / span if span != 0 else 1.0
+    hybrid = alpha * norm + (1 - alpha) * bm25
+    for v, ns, hs in zip(hits, norm.tolist(), hybrid.tolist()):
+        v["vector_score_norm"] = ns
+        v["hybrid_score"] = hs
+    # Stable descending order (ties keep insertion order, as sorted(..., reverse=True) did)
+    results = [hits[i] for i in np.argsort(-hybrid, kind="stable")[:top_k]]
     for r in results:
         r["citation"] = f'{r["source"]}#chunk{r.get("chunk_index",0)}'
     return results
 
 def search_fts(query, top_k=10, mode="both"):
     """
-    Oracle baseline: LIKE-based search over documents.content and/or embeddings.chunk_metadata (as text).
+    Search over documents.content and/or embeddings.chunk_metadata.
+    AUSLEGALSEARCH_ORA_TEXT=1: Oracle Text CONTAINS / JSON_TEXTCONTAINS (index lookups);
+    otherwise (or if the indexes are unavailable) LIKE-based substring search.
     """
-    q = f"%{(query or '').lower()}%"
+    query = query or ""
+    if ORA_TEXT and query.strip():
+        try:
+            return _search_fts(query, top_k, mode, use_text=True)
+        except Exception as e:
+            print(f"[Oracle] Oracle Text search failed, using LIKE: {e}")
+    return _search_fts(query, top_k, mode, use_text=False)
+
+def _search_fts(query, top_k, mode, use_text):
+    # One statement for all requested areas: per-area candidate CTEs are combined with UNION ALL,
+    # deduplicated per doc_id with ROW_NUMBER() (document hit first, else the lowest chunk_index),
+    # and documents/embeddings are joined once for the surviving rows only.
+    if use_text:
+        q = _ctx_query(query)
+        doc_branch = """
+            SELECT id AS doc_id, CAST(NULL AS NUMBER) AS emb_id, CAST(NULL AS NUMBER) AS chunk_index,
+                   0 AS area, -SCORE(1) AS pos
+              FROM documents
+             WHERE CONTAINS(content, :q, 1) > 0
+             ORDER BY SCORE(1) DESC
+             FETCH FIRST :dk ROWS ONLY"""
+        meta_where = "JSON_TEXTCONTAINS(e.chunk_metadata, '$', :q)"
+    else:
+        q = f"%{query.lower()}%"
+        doc_branch = """
+            SELECT id AS doc_id, CAST(NULL AS NUMBER) AS emb_id, CAST(NULL AS NUMBER) AS chunk_index,
+                   0 AS area, ROWNUM AS pos
+              FROM documents
+             WHERE LOWER(content) LIKE :q
+             FETCH FIRST :dk ROWS ONLY"""
+        # chunk_metadata is native JSON; LIKE over its serialized text works for substring
+        meta_where = "LOWER(JSON_SERIALIZE(e.chunk_metadata RETURNING CLOB)) LIKE :q"
+    meta_branch = f"""
+            SELECT e.doc_id, e.id AS emb_id, e.chunk_index, 1 AS area, ROWNUM AS pos
+              FROM embeddings e
+             WHERE {meta_where}
+             FETCH FIRST :mk ROWS ONLY"""
+
+    ctes = []
+    params: Dict[str, Any] = {"q": q, "topk": int(top_k)}
+    if mode in ("documents", "both"):
+        ctes.append(("doc_hits", doc_branch))
+        params["dk"] = int(top_k * 4)
+    if mode in ("metadata", "both"):
+        ctes.append(("meta_hits", meta_branch))
+        params["mk"] = int(top_k * 8)
+    if not ctes:
+        return []
+
+    with_sql = ",\n".join(f"{name} AS ({body}\n        )" for name, body in ctes)
+    union_sql = " UNION ALL ".join(f"SELECT * FROM {name}" for name, _ in ctes)
+    sql = text(f"""
+        WITH {with_sql},
+        h AS (
+            SELECT u.*,
+                   ROW_NUMBER() OVER (PARTITION BY u.doc_id ORDER BY u.area, u.chunk_index NULLS FIRST) AS rn
+              FROM ({union_sql}) u
+        )
+        SELECT h.doc_id, h.chunk_index, d.source, d.content, d.format, e.chunk_metadata, h.area
+          FROM h
+          JOIN documents d ON d.id = h.doc_id
+          LEFT JOIN embeddings e ON e.id = h.emb_id
+         WHERE h.rn = 1
+         ORDER BY h.area, h.pos
+         FETCH FIRST :topk ROWS ONLY
+    """)
     with SessionLocal() as session:
-        all_hits: List[Dict[str, Any]] = []
-
-        if mode in ("documents", "both"):
-            doc_sql = text("""
-                SELECT id as doc_id, source, content, format
-                  FROM documents
-                 WHERE LOWER(content) LIKE :q
-                 FETCH FIRST :topk ROWS ONLY
-            """)
-            doc_hits = session.execute(doc_sql, {"q": q, "topk": int(top_k*4)}).fetchall()
-            for row in doc_hits:
-                all_hits.append({
-                    "doc_id": row[0],
-                    "chunk_index": None,
-                    "source": row[1],
-                    "content": row[2],
-                    "text": row[2],
-                    "format": row[3],
-                    "chunk_metadata": None,
-                    "snippet": None,
-                    "search_area": "documents",
-                    "dedup_key": ("doc", row[0]),
-                })
-
-        if mode in ("metadata", "both"):
-            # chunk_metadata is CLOB JSON; LIKE works for substring
-            chunk_sql = text("""
-                SELECT e.doc_id, e.chunk_index, d.source, d.content, e.chunk_metadata
-                  FROM embeddings e
-                  JOIN documents d ON e.doc_id = d.id
-                 WHERE LOWER(JSON_SERIALIZE(e.chunk_metadata RETURNING CLOB)) LIKE :q
-                 FETCH FIRST :topk ROWS ONLY
-            """)
-            chunk_rows = session.execute(chunk_sql, {"q": q, "topk": int(top_k*8)}).fetchall()
-            for row in chunk_rows:
-                all_hits.append({
-                    "doc_id": row[0],
-                    "chunk_index": row[1],
-                    "source": row[2],
-                    "content": row[3],
-                    "text": row[4],
-                    "format": None,
-                    "chunk_metadata": row[4],
-                    "snippet": None,
-                    "search_area": "metadata",
-                    "dedup_key": ("doc", row[0]),
-                })
-
-        # Deduplicate by doc_id (keep first/lowest chunk_index for metadata)
-        grouped: Dict[Any, Dict[str, Any]] = {}
-        for h in all_hits:
-            key = h.get("dedup_key")
-            if key not in grouped:
-                grouped[key] = h
-            else:
-                if h["search_area"] == "metadata" and grouped[key]["search_area"] == "metadata":
-                    if (h.get("chunk_index") or 999999) < (grouped[key].get("chunk_index") or 999999):
-                        grouped[key] = h
-        return list(grouped.values())[:top_k]
+        rows = session.execute(sql, params).fetchall()
+    hits: List[Dict[str, Any]] = []
+    for row in rows:
+        if row[6] == 0:
+            hits.append({
+                "doc_id": row[0],
+                "chunk_index": None,
+                "source": row[2],
+                "content": row[3],
+                "text": row[3],
+                "format": row[4],
+                "chunk_metadata": None,
+                "snippet": None,
+                "search_area": "documents",
+                "dedup_key": ("doc", row[0]),
+            })
+        else:
+            hits.append({
+                "doc_id": row[0],
+                "chunk_index": row[1],
+                "source": row[2],
+                "content": row[3],
+                "text": row[5],
+                "format": None,
+                "chunk_metadata": row[5],
+                "snippet": None,
+                "search_area": "metadata",
+                "dedup_key": ("doc", row[0]),
+            })
+    return hits
+
+# Decoded file contents keyed on (path, mtime_ns, size): repeat views of an unchanged file skip the
+# read and decode; an edited file gets a new key and the stale entry ages out (LRU, _FILE_CACHE_MAX entries).
+_FILE_CACHE: "OrderedDict[tuple, str]" = OrderedDict()
+_FILE_CACHE_MAX = 64
+_FILE_CACHE_LOCK = threading.Lock()
 
 def get_file_contents(filepath):
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            return f.read()
-    except Exception:
+        st = os.stat(filepath)
+        key = (filepath, st.st_mtime_ns, st.st_size)
+        with _FILE_CACHE_LOCK:
+            if key in _FILE_CACHE:
+                _FILE_CACHE.move_to_end(key)
+                return _FILE_CACHE[key]
+        # One read; decode UTF-8, falling back to latin-1 (which never fails)
+        with open(filepath, "rb") as f:
+            data = f.read()
         try:
-            with open(filepath, "r", encoding="latin-1") as f:
-                return f.read()
-        except Exception:
-            return f"Could not read file: {filepath}"
+            contents = data.decode("utf-8")
+        except UnicodeDecodeError:
+            contents = data.decode("latin-1")
+        # Universal newlines, as text-mode open() gave before the bytes read
+        contents = contents.replace("\r\n", "\n").replace("\r", "\n")
+    except Exception:
+        return f"Could not read file: {filepath}"
+    with _FILE_CACHE_LOCK:
+        _FILE_CACHE[key] = contents
+        _FILE_CACHE.move_to_end(key)
+        while len(_FILE_CACHE) > _FILE_CACHE_MAX:
+            _FILE_CACHE.popitem(last=False)
+    return contents
 
 def add_conversion_file(session_name, src_file, dst_file, status="pending"):
+    stmt = insert(ConversionFile).values(
+        session_name=session_name,
+        src_file=src_file,
+        dst_file=dst_file,
+        status=status,
+        start_time=datetime.utcnow() if status == "pending" else None,
+        success=None
+    ).returning(ConversionFile.id)
     with SessionLocal() as session:
-        cf = ConversionFile(
-            session_name=session_name,
-            src_file=src_file,
-            dst_file=dst_file,
-            status=status,
-            start_time=datetime.utcnow() if status == "pending" else None,
-            success=None
-        )
-        session.add(cf)
+        cf_id = session.execute(stmt).scalar_one()
         session.commit()
-        return cf.id
+        return cf_id
+
+# Rows per executemany call for the bulk bookkeeping inserts below (all pages share one transaction)
+_BULK_PAGE_SIZE = 1000
+
+def _insert_paged(table, rows: List[Dict[str, Any]]) -> int:
+    stmt = table.insert()
+    with engine.begin() as conn:
+        for i in range(0, len(rows), _BULK_PAGE_SIZE):
+            conn.execute(stmt, rows[i:i + _BULK_PAGE_SIZE])
+    return len(rows)
+
+def add_conversion_files(rows: List[Dict[str, Any]]) -> int:
+    """
+    Bulk form of add_conversion_file: rows of {session_name, src_file, dst_file[, status]}.
+    Inserted with Core executemany in pages of 1000 in one transaction; returns the row count.
+    """
+    now = datetime.utcnow()
+    params = []
+    for r in rows:
+        status = r.get("status", "pending")
+        params.append({
+            "session_name": r["session_name"],
+            "src_file": r["src_file"],
+            "dst_file": r["dst_file"],
+            "status": status,
+            "start_time": now if status == "pending" else None,
+            "success": None,
+        })
+    return _insert_paged(ConversionFile.__table__, params) if params else 0
+
+def add_session_files_bulk(session_name: str, filepaths: List[str], status: str = "pending") -> int:
+    """Insert embedding_session_files rows for many files (Core executemany, pages of 1000); returns the row count."""
+    params = [{"session_name": session_name, "filepath": fp, "status": status} for fp in filepaths]
+    return _insert_paged(EmbeddingSessionFile.__table__, params) if params else 0
 
 def update_conversion_file_status(cf_id, status, error_message=None, success=None):
     with SessionLocal() as session:
@@ -752,3 +1282,11 @@ __all__ = [
     "add_conversion_file", "update_conversion_file_status",
     "search_fts",
 ]
+
+# Oracle-only helpers: deliberately not in __all__, so the backend-neutral db.store surface stays the same
+# on both backends. Import them from db.store_oracle directly.
+ORACLE_ONLY = [
+    "add_documents_bulk", "add_embeddings_bulk",
+    "add_conversion_files", "add_session_files_bulk",
+    "fetch_vectors_raw",
+]
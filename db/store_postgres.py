@@ -677,5 +677,6 @@ __all__ = [
     "save_chat_session", "get_chat_session",
     "start_session", "update_session_progress", "complete_session", "fail_session", "get_active_sessions", "get_resume_sessions", "get_session",
     "add_document", "add_embedding", "search_vector", "search_bm25", "search_hybrid", "get_file_contents",
-    "add_conversion_file", "update_conversion_file_status"
+    "add_conversion_file", "update_conversion_file_status",
+    "search_fts",
 ]